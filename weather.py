@@ -11,13 +11,61 @@ Usage:
   python3 weather.py --list                       # show available properties
 """
 
-import argparse
+from __future__ import annotations
+
+import functools
 import json
+import os
 import sys
-import urllib.parse
-import urllib.request
-import urllib.error
-from datetime import datetime
+import time
+import urllib.parse  # already loaded by pathlib, so free to import here
+from collections import namedtuple
+from pathlib import Path
+from types import SimpleNamespace
+
+# Type checkers treat this name as True; a plain constant avoids importing
+# typing at runtime just for the annotation-only imports below.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import http.client
+    import ssl
+    import threading
+
+
+@functools.lru_cache(maxsize=None)
+def _optional_import(name: str):
+    """Return the optional module name, or None if it is not installed.
+
+    Imported on first use rather than at module top, so --list / --help never
+    pay for codecs they don't use; memoized so a missing module is only
+    searched for once.
+    """
+    try:
+        return __import__(name)
+    except ImportError:
+        return None
+
+
+def _json_loads(data):
+    """Parse JSON bytes with orjson or ujson when available, else the stdlib.
+
+    Both fast decoders accept bytes directly.
+    """
+    orjson = _optional_import("orjson")
+    if orjson is not None:
+        return orjson.loads(data)
+    ujson = _optional_import("ujson")
+    if ujson is not None:
+        return ujson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> str:
+    """Serialize obj as 2-space-indented JSON, with orjson when available."""
+    orjson = _optional_import("orjson")
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2)
 
 DEFAULT_CITY = "Maple Valley, WA"
 DEFAULT_PROPERTIES = ["temperature", "humidity"]
@@ -25,157 +73,388 @@ DEFAULT_PROPERTIES = ["temperature", "humidity"]
 NWS_BASE = "https://api.weather.gov"
 GEOCODE_BASE = "https://geocoding-api.open-meteo.com/v1"
 
+# Optional bundled coordinates for common cities, keyed like _normalize_city()
+CITIES_FILE = Path(__file__).with_name("cities.json")
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "weather-cli"
+POINTS_TTL = 30 * 86400    # grid/station-list URL for a coordinate: effectively static
+STATION_TTL = 7 * 86400    # resolved nearest station for a coordinate
+GEOCODE_TTL = 30 * 86400   # city -> coordinates
+OBSERVATION_TTL = 60       # latest observation: reused as-is, then revalidated by ETag
+
 HEADERS = {
     "User-Agent": "(WeatherCLI/1.0, weather-cli@example.com)",
     "Accept": "application/geo+json",
+    "Accept-Encoding": "gzip",
+}
+
+GEOCODE_HEADERS = {
+    "User-Agent": "WeatherCLI/1.0",
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip",
 }
 
 # ---------------------------------------------------------------------------
 # Unit conversions
 # ---------------------------------------------------------------------------
 
-def _c_to_f(c):
-    return (c * 9 / 5) + 32
-
-def _kmh_to_mph(kmh):
-    return kmh * 0.621371
-
-def _pa_to_inhg(pa):
-    return pa * 0.000295299
+_KMH_TO_MPH = 0.621371
+_PA_TO_INHG = 0.000295299
+_M_TO_MI = 0.000621371
+_MM_TO_IN = 0.0393701
 
-def _m_to_mi(m):
-    return m * 0.000621371
+_COMPASS = ("N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
+            "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW")
 
 def _degrees_to_compass(deg):
-    directions = ["N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
-                  "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"]
-    return directions[round(deg / 22.5) % 16]
+    # Each point covers 22.5°, centred on its heading; & 15 wraps 360° to N
+    return _COMPASS[int((deg + 11.25) // 22.5) & 15]
 
 # ---------------------------------------------------------------------------
 # Property registry
-# Each entry: api_key, label, format_fn, json_fn
+# Each entry: api_key, label, fmt (text formatter), to_json (JSON formatter)
 # ---------------------------------------------------------------------------
 
 def _temp_fmt(v):
-    return f"{_c_to_f(v):.1f}°F  ({v:.1f}°C)"
+    return f"{v * 9 / 5 + 32:.1f}°F  ({v:.1f}°C)"
 
 def _wind_speed_fmt(v):
-    return f"{_kmh_to_mph(v):.1f} mph  ({v:.1f} km/h)"
+    return f"{v * _KMH_TO_MPH:.1f} mph  ({v:.1f} km/h)"
 
 def _pressure_fmt(v):
-    return f"{_pa_to_inhg(v):.2f} inHg  ({v / 100:.1f} hPa)"
+    return f"{v * _PA_TO_INHG:.2f} inHg  ({v / 100:.1f} hPa)"
 
 def _temp_json(v):
-    return {"fahrenheit": round(_c_to_f(v), 1), "celsius": round(v, 1)}
+    return {"fahrenheit": round(v * 9 / 5 + 32, 1), "celsius": round(v, 1)}
 
 def _wind_speed_json(v):
-    return {"mph": round(_kmh_to_mph(v), 1), "kmh": round(v, 1)}
+    return {"mph": round(v * _KMH_TO_MPH, 1), "kmh": round(v, 1)}
 
 def _pressure_json(v):
-    return {"inhg": round(_pa_to_inhg(v), 2), "hpa": round(v / 100, 1)}
+    return {"inhg": round(v * _PA_TO_INHG, 2), "hpa": round(v / 100, 1)}
+
+# A namedtuple rather than a dataclass: same attribute access, without the
+# dataclasses/inspect import cost on every start.
+Prop = namedtuple("Prop", ["api_key", "label", "fmt", "to_json"])
 
 PROPERTIES = {
-    "temperature": {
-        "api_key": "temperature",
-        "label": "Temperature",
-        "format": _temp_fmt,
-        "json": _temp_json,
-    },
-    "humidity": {
-        "api_key": "relativeHumidity",
-        "label": "Humidity",
-        "format": lambda v: f"{v:.1f}%",
-        "json": lambda v: {"percent": round(v, 1)},
-    },
-    "dewpoint": {
-        "api_key": "dewpoint",
-        "label": "Dewpoint",
-        "format": _temp_fmt,
-        "json": _temp_json,
-    },
-    "wind-chill": {
-        "api_key": "windChill",
-        "label": "Wind Chill",
-        "format": _temp_fmt,
-        "json": _temp_json,
-    },
-    "heat-index": {
-        "api_key": "heatIndex",
-        "label": "Heat Index",
-        "format": _temp_fmt,
-        "json": _temp_json,
-    },
-    "wind": {
-        "api_key": "windSpeed",
-        "label": "Wind Speed",
-        "format": _wind_speed_fmt,
-        "json": _wind_speed_json,
-    },
-    "wind-direction": {
-        "api_key": "windDirection",
-        "label": "Wind Direction",
-        "format": lambda v: f"{_degrees_to_compass(v)}  ({v:.0f}°)",
-        "json": lambda v: {"compass": _degrees_to_compass(v), "degrees": round(v)},
-    },
-    "wind-gust": {
-        "api_key": "windGust",
-        "label": "Wind Gust",
-        "format": _wind_speed_fmt,
-        "json": _wind_speed_json,
-    },
-    "pressure": {
-        "api_key": "barometricPressure",
-        "label": "Pressure",
-        "format": _pressure_fmt,
-        "json": _pressure_json,
-    },
-    "sea-pressure": {
-        "api_key": "seaLevelPressure",
-        "label": "Sea Level Pressure",
-        "format": _pressure_fmt,
-        "json": _pressure_json,
-    },
-    "visibility": {
-        "api_key": "visibility",
-        "label": "Visibility",
-        "format": lambda v: f"{_m_to_mi(v):.1f} mi  ({v / 1000:.1f} km)",
-        "json": lambda v: {"miles": round(_m_to_mi(v), 1), "km": round(v / 1000, 1)},
-    },
-    "max-temp": {
-        "api_key": "maxTemperatureLast24Hours",
-        "label": "Max Temp (24h)",
-        "format": _temp_fmt,
-        "json": _temp_json,
-    },
-    "min-temp": {
-        "api_key": "minTemperatureLast24Hours",
-        "label": "Min Temp (24h)",
-        "format": _temp_fmt,
-        "json": _temp_json,
-    },
-    "precipitation": {
-        "api_key": "precipitationLast3Hours",
-        "label": "Precipitation (3h)",
-        "format": lambda v: f"{v * 0.0393701:.2f} in  ({v:.1f} mm)",
-        "json": lambda v: {"inches": round(v * 0.0393701, 2), "mm": round(v, 1)},
-    },
+    "temperature": Prop(
+        api_key="temperature",
+        label="Temperature",
+        fmt=_temp_fmt,
+        to_json=_temp_json,
+    ),
+    "humidity": Prop(
+        api_key="relativeHumidity",
+        label="Humidity",
+        fmt=lambda v: f"{v:.1f}%",
+        to_json=lambda v: {"percent": round(v, 1)},
+    ),
+    "dewpoint": Prop(
+        api_key="dewpoint",
+        label="Dewpoint",
+        fmt=_temp_fmt,
+        to_json=_temp_json,
+    ),
+    "wind-chill": Prop(
+        api_key="windChill",
+        label="Wind Chill",
+        fmt=_temp_fmt,
+        to_json=_temp_json,
+    ),
+    "heat-index": Prop(
+        api_key="heatIndex",
+        label="Heat Index",
+        fmt=_temp_fmt,
+        to_json=_temp_json,
+    ),
+    "wind": Prop(
+        api_key="windSpeed",
+        label="Wind Speed",
+        fmt=_wind_speed_fmt,
+        to_json=_wind_speed_json,
+    ),
+    "wind-direction": Prop(
+        api_key="windDirection",
+        label="Wind Direction",
+        fmt=lambda v: f"{_degrees_to_compass(v)}  ({v:.0f}°)",
+        to_json=lambda v: {"compass": _degrees_to_compass(v), "degrees": round(v)},
+    ),
+    "wind-gust": Prop(
+        api_key="windGust",
+        label="Wind Gust",
+        fmt=_wind_speed_fmt,
+        to_json=_wind_speed_json,
+    ),
+    "pressure": Prop(
+        api_key="barometricPressure",
+        label="Pressure",
+        fmt=_pressure_fmt,
+        to_json=_pressure_json,
+    ),
+    "sea-pressure": Prop(
+        api_key="seaLevelPressure",
+        label="Sea Level Pressure",
+        fmt=_pressure_fmt,
+        to_json=_pressure_json,
+    ),
+    "visibility": Prop(
+        api_key="visibility",
+        label="Visibility",
+        fmt=lambda v: f"{v * _M_TO_MI:.1f} mi  ({v / 1000:.1f} km)",
+        to_json=lambda v: {"miles": round(v * _M_TO_MI, 1), "km": round(v / 1000, 1)},
+    ),
+    "max-temp": Prop(
+        api_key="maxTemperatureLast24Hours",
+        label="Max Temp (24h)",
+        fmt=_temp_fmt,
+        to_json=_temp_json,
+    ),
+    "min-temp": Prop(
+        api_key="minTemperatureLast24Hours",
+        label="Min Temp (24h)",
+        fmt=_temp_fmt,
+        to_json=_temp_json,
+    ),
+    "precipitation": Prop(
+        api_key="precipitationLast3Hours",
+        label="Precipitation (3h)",
+        fmt=lambda v: f"{v * _MM_TO_IN:.2f} in  ({v:.1f} mm)",
+        to_json=lambda v: {"inches": round(v * _MM_TO_IN, 2), "mm": round(v, 1)},
+    ),
 }
 
 # ---------------------------------------------------------------------------
 # Network
 # ---------------------------------------------------------------------------
 
+# The http.client/ssl/gzip stack is imported inside the functions below, so
+# paths that never touch the network (--list, --help) skip its import cost.
+
+# One keep-alive connection per host, so the points -> stations -> observation
+# sequence against api.weather.gov pays for a single TCP + TLS handshake.
+_connections: dict[str, http.client.HTTPSConnection] = {}
+
+MAX_REDIRECTS = 5
+
+
+class FetchError(Exception):
+    """A request failed; str() is the message shown to the user."""
+
+
+@functools.lru_cache(maxsize=None)
+def _ssl_context() -> ssl.SSLContext:
+    # Shared by every connection so the CA bundle is loaded once per run,
+    # not once per host as with HTTPSConnection's default context.
+    import ssl
+
+    return ssl.create_default_context()
+
+
+def _connection(host: str) -> http.client.HTTPSConnection:
+    conn = _connections.get(host)
+    if conn is None:
+        import http.client
+        import urllib.request
+
+        # Honour https_proxy / no_proxy (and the OS proxy settings) the way
+        # urlopen()'s ProxyHandler does: connect to the proxy and CONNECT-tunnel
+        # through it to host.
+        proxy = urllib.request.getproxies().get("https")
+        if proxy and not urllib.request.proxy_bypass(host):
+            parts = urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+            conn = http.client.HTTPSConnection(parts.hostname, parts.port, timeout=10, context=_ssl_context())
+            tunnel_headers = {}
+            if parts.username:
+                import base64
+
+                credentials = f"{urllib.parse.unquote(parts.username)}:{urllib.parse.unquote(parts.password or '')}"
+                tunnel_headers["Proxy-Authorization"] = "Basic " + base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+            conn.set_tunnel(host, headers=tunnel_headers)
+        else:
+            conn = http.client.HTTPSConnection(host, timeout=10, context=_ssl_context())
+        _connections[host] = conn
+    return conn
+
+
+def preconnect(url: str) -> None:
+    """Open the pooled connection for url's host ahead of its first request."""
+    conn = _connection(urllib.parse.urlsplit(url).netloc)
+    try:
+        conn.connect()
+    except OSError:
+        conn.close()  # the real request reconnects and reports the error
+
+
+def start_preconnect(url: str) -> threading.Thread:
+    """Run preconnect(url) on a background thread; join it before requesting url's host."""
+    import threading
+
+    _ssl_context()  # load the CA bundle once, before both threads need it
+    thread = threading.Thread(target=preconnect, args=(url,))
+    thread.start()
+    return thread
+
+
+def _request(conn: http.client.HTTPSConnection, target: str, headers: dict) -> tuple[http.client.HTTPResponse, bytes]:
+    while True:
+        reused = conn.sock is not None
+        try:
+            conn.request("GET", target, headers=headers)
+            resp = conn.getresponse()
+            return resp, resp.read()
+        except (ConnectionResetError, BrokenPipeError):
+            # The server may drop an idle keep-alive connection between our
+            # requests; retry once on a fresh connection.
+            conn.close()
+            if not reused:
+                raise
+
+
+def _get(url: str, headers: dict) -> tuple[http.client.HTTPResponse, bytes]:
+    """GET url following redirects; raises FetchError on network errors and non-2xx/304 statuses."""
+    import gzip
+    import http.client
+    import zlib
+
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urllib.parse.urlsplit(url)
+        target = parts.path or "/"
+        if parts.query:
+            target += f"?{parts.query}"
+        conn = _connection(parts.netloc)
+        try:
+            resp, body = _request(conn, target, headers)
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            raise FetchError(f"Network error - {e}") from e
+
+        location = resp.getheader("Location")
+        if resp.status in (301, 302, 303, 307, 308) and location:
+            url = urllib.parse.urljoin(url, location)
+            continue
+        if resp.status != 304 and not 200 <= resp.status < 300:
+            raise FetchError(f"HTTP {resp.status} fetching {url}")
+        if resp.getheader("Content-Encoding") == "gzip":
+            try:
+                body = gzip.decompress(body)
+            except (OSError, EOFError, zlib.error) as e:  # corrupt or truncated body
+                raise FetchError(f"Invalid gzip response from {url} - {e}") from e
+        return resp, body
+
+    raise FetchError(f"Too many redirects fetching {url}")
+
+
+def fetch_bytes(url: str, headers: dict | None = None) -> bytes:
+    return _get(url, headers or HEADERS)[1]
+
+
 def fetch(url: str, headers: dict | None = None) -> dict:
-    req = urllib.request.Request(url, headers=headers or HEADERS)
+    return _json_loads(fetch_bytes(url, headers))
+
+# ---------------------------------------------------------------------------
+# Cache
+# Raw response bodies on disk, keyed by URL; freshness is the file mtime.
+# ---------------------------------------------------------------------------
+
+def _cache_path(key: str) -> Path:
+    import hashlib
+
+    return CACHE_DIR / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
+
+
+def _cache_get(key: str, ttl: float) -> bytes | None:
+    path = _cache_path(key)
     try:
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            return json.loads(resp.read().decode("utf-8"))
-    except urllib.error.HTTPError as e:
-        print(f"Error: HTTP {e.code} fetching {url}", file=sys.stderr)
-        sys.exit(1)
-    except urllib.error.URLError as e:
-        print(f"Error: Network error - {e.reason}", file=sys.stderr)
-        sys.exit(1)
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def _cache_set(key: str, data: bytes) -> None:
+    # Write to a temp file and rename it into place, so a concurrent run never
+    # reads a half-written entry.
+    import tempfile
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, _cache_path(key))
+        except OSError:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass  # caching is best-effort
+
+
+def _cache_touch(key: str) -> None:
+    try:
+        os.utime(_cache_path(key))
+    except OSError:
+        pass
+
+
+# Response validator header -> conditional request header that sends it back
+_VALIDATORS = {
+    "ETag": "If-None-Match",
+    "Last-Modified": "If-Modified-Since",
+}
+
+
+def _split_response(entry: bytes) -> tuple[bytes, dict]:
+    """Split a revalidated_fetch_bytes() cache entry into (body, conditional request headers)."""
+    validators, _, body = entry.partition(b"\n")
+    return body, _json_loads(validators)
+
+
+def revalidated_fetch_bytes(url: str, ttl: float = 0) -> bytes:
+    """Fetch url, reusing the cached body for ttl seconds and revalidating it after that.
+
+    The stored ETag / Last-Modified are sent as If-None-Match / If-Modified-Since,
+    so an unchanged resource costs only a bodiless 304.
+    """
+    # One entry holds a JSON line of validators followed by the body, so a
+    # 304 can only ever confirm the body those validators came with.
+    cache_key = f"response:{url}"
+    fresh = _cache_get(cache_key, ttl)
+    if fresh is not None:
+        return _split_response(fresh)[0]
+
+    cached = _cache_get(cache_key, float("inf"))
+    headers = HEADERS
+    if cached is not None:
+        cached, validators = _split_response(cached)
+        headers = {**HEADERS, **validators}
+
+    resp, body = _get(url, headers)
+    if resp.status == 304:
+        _cache_touch(cache_key)  # restart the freshness window
+        return cached
+
+    validators = {}
+    for response_header, request_header in _VALIDATORS.items():
+        value = resp.getheader(response_header)
+        if value:
+            validators[request_header] = value
+    _cache_set(cache_key, json.dumps(validators).encode("utf-8") + b"\n" + body)
+    return body
+
+
+def _stale_or_exit(key: str, error: FetchError, allow_stale: bool) -> bytes:
+    """After a failed request, return the last cached entry for key (any age) or exit."""
+    if allow_stale:
+        stale = _cache_get(key, float("inf"))
+        if stale is not None:
+            saved = time.strftime("%Y-%m-%d %I:%M %p", time.localtime(_cache_path(key).stat().st_mtime))
+            print(f"Warning: {error}; using cached data from {saved}", file=sys.stderr)
+            return stale
+    print(f"Error: {error}", file=sys.stderr)
+    sys.exit(1)
+
 
 # ---------------------------------------------------------------------------
 # Geocoding
@@ -197,22 +476,77 @@ STATE_ABBREVS = {
     "wi": "Wisconsin", "wy": "Wyoming", "dc": "District of Columbia",
 }
 
+# Lowercased state hint (abbreviation or full name) -> full name as spelled in
+# the geocoder's admin1 field, so results compare without per-result .lower().
+_STATE_LOOKUP = dict(STATE_ABBREVS)
+_STATE_LOOKUP.update({full.lower(): full for full in STATE_ABBREVS.values()})
 
-def geocode(city: str) -> tuple[float, float, str]:
-    """Return (latitude, longitude, display_name) for a US city."""
-    name = city.split(",")[0].strip()
-    params = urllib.parse.urlencode({"name": name, "count": 10, "language": "en", "format": "json"})
-    url = f"{GEOCODE_BASE}/search?{params}"
-    data = fetch(url, headers={"User-Agent": "WeatherCLI/1.0", "Accept": "application/json"})
-    results = [r for r in data.get("results", []) if r.get("country_code") == "US"]
-    if not results:
+# Constant part of the geocoding query string; only the name varies per call.
+_GEOCODE_QUERY_SUFFIX = "&count=10&countryCode=US&language=en&format=json"
+
+
+def geocode(city: str, allow_stale: bool = True, on_network_miss=None) -> tuple[float, float, str]:
+    """Return (latitude, longitude, display_name) for a US city.
+
+    on_network_miss, if given, is called with no arguments just before the
+    geocoding API is queried; bundled and cached cities never call it.
+    """
+    result = _geocode_impl(_normalize_city(city), allow_stale, on_network_miss)
+    if result is None:
         print(f"Error: Could not find '{city}' in the United States.", file=sys.stderr)
         sys.exit(1)
+    return result
 
-    if "," in city:
-        state_hint = city.split(",", 1)[1].strip().lower()
-        full_state = STATE_ABBREVS.get(state_hint, state_hint).lower()
-        filtered = [r for r in results if r.get("admin1", "").lower() == full_state]
+
+def _bundled_cities() -> dict:
+    try:
+        return _json_loads(CITIES_FILE.read_bytes())
+    except OSError:
+        return {}
+
+
+def _normalize_city(city: str) -> str:
+    """Canonical lookup key, so "seattle,wa" and "Seattle,  WA" share one entry."""
+    name, sep, state = city.partition(",")
+    key = " ".join(name.split()).lower()
+    if sep:
+        key += ", " + " ".join(state.split()).lower()
+    return key
+
+
+def _geocode_impl(key: str, allow_stale: bool, on_network_miss) -> tuple[float, float, str] | None:
+    """Resolve a normalized city string from the bundled table, the disk cache, or the API."""
+    bundled = _bundled_cities().get(key)
+    if bundled is not None:
+        lat, lon, display_name = bundled
+        return lat, lon, display_name
+
+    cache_key = f"geocode:{key}"
+    cached = _cache_get(cache_key, GEOCODE_TTL)
+    if cached is not None:
+        lat, lon, display_name = _json_loads(cached)
+        return lat, lon, display_name
+
+    name = key.split(",")[0].strip()
+    url = f"{GEOCODE_BASE}/search?name={urllib.parse.quote_plus(name)}{_GEOCODE_QUERY_SUFFIX}"
+    if on_network_miss is not None:
+        on_network_miss()
+    try:
+        data = fetch(url, headers=GEOCODE_HEADERS)
+    except FetchError as e:
+        lat, lon, display_name = _json_loads(_stale_or_exit(cache_key, e, allow_stale))
+        return lat, lon, display_name
+    results = data.get("results", [])
+    if not results:
+        return None
+
+    if "," in key:
+        state_hint = key.split(",", 1)[1].strip()
+        full_state = _STATE_LOOKUP.get(state_hint)
+        if full_state is not None:
+            filtered = [r for r in results if r.get("admin1") == full_state]
+        else:
+            filtered = [r for r in results if r.get("admin1", "").lower() == state_hint]
         if filtered:
             results = filtered
 
@@ -221,46 +555,157 @@ def geocode(city: str) -> tuple[float, float, str]:
     if r.get("admin1"):
         parts.append(r["admin1"])
     parts.append("US")
-    return float(r["latitude"]), float(r["longitude"]), ", ".join(parts)
+    result = (float(r["latitude"]), float(r["longitude"]), ", ".join(parts))
+    _cache_set(cache_key, json.dumps(result).encode("utf-8"))
+    return result
 
 # ---------------------------------------------------------------------------
 # NWS observations
 # ---------------------------------------------------------------------------
 
-def get_observation(lat: float, lon: float) -> tuple[str, str, dict]:
-    """Return (station_name, station_id, props dict) for the nearest station."""
-    points_data = fetch(f"{NWS_BASE}/points/{lat:.4f},{lon:.4f}")
-    stations_url = points_data["properties"]["observationStations"]
+def _observation_decoder(api_keys: frozenset[str]):
+    """msgspec decoder for an observation that reads only api_keys plus the timestamp."""
+    import msgspec  # callers check _optional_import("msgspec") first
 
-    stations_data = fetch(stations_url)
-    features = stations_data.get("features", [])
+    measurement = msgspec.defstruct("_Measurement", [("value", int | float | None, None)])
+    props = msgspec.defstruct(
+        "_ObservationProps",
+        [(key, measurement | None, None) for key in sorted(api_keys)]
+        + [("timestamp", str | None, None)],
+    )
+    response = msgspec.defstruct("_ObservationResponse", [("properties", props)])
+    return msgspec.json.Decoder(response).decode
+
+
+def _first_station(body: bytes) -> tuple[str, str] | None:
+    """Return (station_id, station_name) of the first (nearest) feature."""
+    # simdjson parses lazily (only touched fields are materialized); msgspec
+    # skips every field not declared in the schema.
+    simdjson = _optional_import("simdjson")
+    if simdjson is not None:
+        doc = simdjson.Parser().parse(body)
+        try:
+            props = doc.at_pointer("/features/0/properties")
+        except (KeyError, IndexError):
+            return None
+        return props["stationIdentifier"], props["name"]
+
+    msgspec = _optional_import("msgspec")
+    if msgspec is not None:
+        station = msgspec.defstruct("_Station", [("stationIdentifier", str), ("name", str)])
+        feature = msgspec.defstruct("_StationFeature", [("properties", station)])
+        response = msgspec.defstruct("_StationsResponse", [("features", list[feature], [])])
+        features = msgspec.json.decode(body, type=response).features
+        if not features:
+            return None
+        return features[0].properties.stationIdentifier, features[0].properties.name
+
+    features = _json_loads(body).get("features", [])
     if not features:
+        return None
+    return features[0]["properties"]["stationIdentifier"], features[0]["properties"]["name"]
+
+
+def _observation_props(body: bytes, api_keys: frozenset[str]) -> dict:
+    """Return the observation's properties as {api_key: {"value": ...}, "timestamp": ...}.
+
+    With msgspec only api_keys are decoded; the stdlib path returns every key.
+    """
+    msgspec = _optional_import("msgspec")
+    if msgspec is not None:
+        return msgspec.to_builtins(_observation_decoder(api_keys)(body).properties)
+    return _json_loads(body)["properties"]
+
+
+def _nearest_station(lat: float, lon: float) -> tuple[str, str]:
+    """Return (station_id, station_name) via the points and stations endpoints."""
+    points_data = _json_loads(revalidated_fetch_bytes(f"{NWS_BASE}/points/{lat:.4f},{lon:.4f}", POINTS_TTL))
+    stations_url = points_data["properties"]["observationStations"]
+
+    # The list is sorted by distance; ask for just the nearest feature
+    sep = "&" if "?" in stations_url else "?"
+    station = _first_station(fetch_bytes(f"{stations_url}{sep}limit=1"))
+    if station is None:
         print("Error: No observation stations found near this location.", file=sys.stderr)
         sys.exit(1)
-    station_id = features[0]["properties"]["stationIdentifier"]
-    station_name = features[0]["properties"]["name"]
+    return station
+
+
+_ALL_API_KEYS = frozenset(prop.api_key for prop in PROPERTIES.values())
+
 
-    obs_data = fetch(f"{NWS_BASE}/stations/{station_id}/observations/latest")
-    return station_name, station_id, obs_data["properties"]
+def get_observation(
+    lat: float, lon: float, api_keys: frozenset[str] = _ALL_API_KEYS, allow_stale: bool = True
+) -> tuple[str, str, dict]:
+    """Return (station_name, station_id, props dict) for the nearest station.
+
+    Only the observation fields named in api_keys (plus the timestamp) need to be present.
+    """
+    # Only the (id, name) projection is cached, so a hit skips both the points
+    # lookup and the (large) stations list.
+    station_key = f"station:{lat:.4f},{lon:.4f}"
+    cached = _cache_get(station_key, STATION_TTL)
+    if cached is not None:
+        station_id, station_name = _json_loads(cached)
+    else:
+        try:
+            station_id, station_name = _nearest_station(lat, lon)
+            _cache_set(station_key, json.dumps([station_id, station_name]).encode("utf-8"))
+        except FetchError as e:
+            station_id, station_name = _json_loads(_stale_or_exit(station_key, e, allow_stale))
+
+    obs_url = f"{NWS_BASE}/stations/{station_id}/observations/latest"
+    try:
+        obs_body = revalidated_fetch_bytes(obs_url, OBSERVATION_TTL)
+    except FetchError as e:
+        obs_body = _split_response(_stale_or_exit(f"response:{obs_url}", e, allow_stale))[0]
+    return station_name, station_id, _observation_props(obs_body, api_keys)
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+# datetime.fromisoformat() accepts a trailing "Z" from Python 3.11 on
+_ISO_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
 def format_timestamp(ts: str) -> str:
     if not ts:
         return "Unknown"
+    from datetime import datetime  # deferred: only the text output path needs it
+
     try:
-        dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+        dt = datetime.fromisoformat(ts if _ISO_ACCEPTS_Z else ts.replace("Z", "+00:00"))
         return dt.astimezone().strftime("%Y-%m-%d %I:%M %p %Z")
     except ValueError:
         return ts
 
+def list_output(as_json: bool) -> str:
+    """Return the full --list text, plain or JSON, for a single write."""
+    if as_json:
+        return _json_dumps({
+            "default": DEFAULT_PROPERTIES,
+            "properties": {
+                name: {"label": prop.label, "default": name in DEFAULT_PROPERTIES}
+                for name, prop in PROPERTIES.items()
+            },
+        }) + "\n"
+
+    max_len = max(len(k) for k in PROPERTIES)
+    lines = ["Available properties:"]
+    for name, prop in PROPERTIES.items():
+        marker = " *" if name in DEFAULT_PROPERTIES else ""
+        lines.append(f"  {name:<{max_len}}  {prop.label}{marker}")
+    lines.append("\n* default")
+    return "\n".join(lines) + "\n"
+
 # ---------------------------------------------------------------------------
 # Entry point
 # ---------------------------------------------------------------------------
 
-def main():
+def parse_args():
+    import argparse  # deferred: the no-argument fast path in main() never needs it
+
     parser = argparse.ArgumentParser(
         description="Get current weather data for a US city.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -282,6 +727,7 @@ def main():
     parser.add_argument(
         "-p", "--properties",
         nargs="+",
+        choices=PROPERTIES,
         metavar="PROP",
         default=DEFAULT_PROPERTIES,
         help=(
@@ -299,47 +745,48 @@ def main():
         action="store_true",
         help="output results as JSON (progress messages go to stderr)",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--no-stale",
+        dest="allow_stale",
+        action="store_false",
+        help="exit with an error instead of falling back to cached data when a request fails",
+    )
+    return parser.parse_args()
+
+
+def main():
+    if len(sys.argv) == 1:
+        # Default invocation: skip importing and building the argparse parser
+        args = SimpleNamespace(city=DEFAULT_CITY, properties=DEFAULT_PROPERTIES, list=False, json=False, allow_stale=True)
+    else:
+        args = parse_args()
 
     if args.list:
-        if args.json:
-            print(json.dumps({
-                "default": DEFAULT_PROPERTIES,
-                "properties": {
-                    name: {"label": meta["label"], "default": name in DEFAULT_PROPERTIES}
-                    for name, meta in PROPERTIES.items()
-                },
-            }, indent=2))
-        else:
-            max_len = max(len(k) for k in PROPERTIES)
-            print("Available properties:")
-            for name, meta in PROPERTIES.items():
-                marker = " *" if name in DEFAULT_PROPERTIES else ""
-                print(f"  {name:<{max_len}}  {meta['label']}{marker}")
-            print("\n* default")
+        sys.stdout.write(list_output(args.json))
         return
 
-    # Validate requested properties
-    unknown = [p for p in args.properties if p not in PROPERTIES]
-    if unknown:
-        print(f"Error: Unknown {'property' if len(unknown) == 1 else 'properties'}: {', '.join(unknown)}", file=sys.stderr)
-        print(f"Run with --list to see available properties.", file=sys.stderr)
-        sys.exit(1)
-
     log = (lambda msg: print(msg, file=sys.stderr)) if args.json else print
 
     log(f"Looking up '{args.city}'...")
-    lat, lon, display_name = geocode(args.city)
+    # If geocoding has to hit the network, overlap DNS + TCP + TLS setup for
+    # api.weather.gov with that request
+    warmups = []
+    lat, lon, display_name = geocode(
+        args.city, args.allow_stale, on_network_miss=lambda: warmups.append(start_preconnect(NWS_BASE))
+    )
+    for thread in warmups:
+        thread.join()
 
     log("Fetching weather data...")
-    station_name, station_id, obs_props = get_observation(lat, lon)
+    api_keys = frozenset(PROPERTIES[p].api_key for p in args.properties)
+    station_name, station_id, obs_props = get_observation(lat, lon, api_keys, args.allow_stale)
 
-    # Collect values for all requested properties
-    prop_values = {}
+    # Resolve each requested property and its value once; both outputs use this
+    resolved = []
     for prop_name in args.properties:
-        meta = PROPERTIES[prop_name]
-        raw = obs_props.get(meta["api_key"], {})
-        prop_values[prop_name] = raw.get("value") if isinstance(raw, dict) else None
+        prop = PROPERTIES[prop_name]
+        raw = obs_props.get(prop.api_key, {})
+        resolved.append((prop_name, prop, raw.get("value") if isinstance(raw, dict) else None))
 
     if args.json:
         ts = obs_props.get("timestamp")
@@ -348,27 +795,26 @@ def main():
             "station": {"name": station_name, "id": station_id},
             "observed": ts,
             "properties": {
-                name: (PROPERTIES[name]["json"](v) if v is not None else None)
-                for name, v in prop_values.items()
+                name: (prop.to_json(v) if v is not None else None)
+                for name, prop, v in resolved
             },
         }
-        print(json.dumps(output, indent=2))
+        print(_json_dumps(output))
     else:
-        print()
-        print(f"Location : {display_name}")
-        print(f"Station  : {station_name} ({station_id})")
-        print(f"Observed : {format_timestamp(obs_props.get('timestamp'))}")
-        print()
-
-        label_width = max(len(PROPERTIES[p]["label"]) for p in args.properties)
-        for prop_name in args.properties:
-            meta = PROPERTIES[prop_name]
-            value = prop_values[prop_name]
-            label = meta["label"]
-            if value is not None:
-                print(f"{label:<{label_width}}  :  {meta['format'](value)}")
-            else:
-                print(f"{label:<{label_width}}  :  Data unavailable")
+        lines = [
+            "",
+            f"Location : {display_name}",
+            f"Station  : {station_name} ({station_id})",
+            f"Observed : {format_timestamp(obs_props.get('timestamp'))}",
+            "",
+        ]
+
+        label_width = max(len(prop.label) for _, prop, _ in resolved)
+        for _, prop, value in resolved:
+            lines.append(f"{prop.label:<{label_width}}  :  {prop.fmt(value) if value is not None else 'Data unavailable'}")
+
+        # One write for the whole report instead of a print() per line
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":